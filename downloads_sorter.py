@@ -10,28 +10,122 @@ into appropriate subdirectories based on their file extensions:
 - PDFs: .pdf
 """
 
+import errno
 import os
 import sys
 import time
 import shutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+import atexit
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('downloads_sorter.log'),
-        logging.StreamHandler()
-    ]
+
+# Configure logging. The sorter thread only enqueues records; a background
+# QueueListener thread does the actual file/console writes so a burst of
+# moves never blocks on log I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_file_handler = RotatingFileHandler(
+    'downloads_sorter.log', maxBytes=1_000_000, backupCount=3, delay=True
 )
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_queue_handler = QueueHandler(_log_queue)
+# QueueHandler.prepare bakes its formatter's output into the queued record;
+# keep it message-only so the listener's handlers apply the real format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+
+_log_listener = QueueListener(_log_queue, _log_file_handler, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 
+def _rename(source: Path, destination: Path):
+    """
+    Move a path with os.rename, falling back to shutil.move across devices.
+
+    Downloads and its category subfolders normally live on the same
+    filesystem, so a single rename syscall suffices; shutil.move's
+    copy-and-delete machinery is only needed for the cross-device case.
+    """
+    try:
+        os.rename(source, destination)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            shutil.move(str(source), str(destination))
+        else:
+            raise
+
+
+# In-progress download files written by browsers; the browser renames them
+# when the download completes, which arrives as a separate moved event
+PARTIAL_DOWNLOAD_SUFFIXES = frozenset({".crdownload", ".part", ".download", ".tmp"})
+
+# OS and application noise that should stay put: dotfiles (.DS_Store,
+# .localized), Office lock files (~$doc.docx) and Windows metadata
+SKIP_PREFIXES = (".", "~$")
+SKIP_NAMES = frozenset({"Thumbs.db", "desktop.ini"})
+
+
+def _should_skip(name: str) -> bool:
+    """Return True for hidden/system/in-progress entries to leave alone."""
+    return (name.startswith(SKIP_PREFIXES)
+            or name in SKIP_NAMES
+            or os.path.splitext(name)[1].lower() in PARTIAL_DOWNLOAD_SUFFIXES)
+
+# How long the size/mtime of a new file must hold still before we move it
+STABLE_CHECK_INTERVAL = 0.2
+
+# Samples per stability attempt before giving the worker back; a file
+# written in place for minutes must not pin an event worker indefinitely
+STABLE_MAX_CHECKS = 25
+
+# How many times an unstable file is re-queued (to the back of the event
+# queue) before we leave it for the next startup scan
+MAX_EVENT_RETRIES = 3
+
+# Enough workers to overlap rename latency during the initial scan without
+# hammering the filesystem with thousands of concurrent operations
+MAX_MOVE_WORKERS = 16
+
+# Workers that process watcher events; each may block in the stability
+# wait, so a few in parallel keep bursts flowing
+MAX_EVENT_WORKERS = 4
+
+# Back-pressure bound on queued events: when a burst outruns the workers
+# the producer blocks instead of buffering without limit
+EVENT_QUEUE_SIZE = 1024
+
+
+class DownloadsEventHandler(FileSystemEventHandler):
+    """Watchdog event handler that forwards new entries to the sorter."""
+
+    def __init__(self, sorter: "DownloadsSorter"):
+        self.sorter = sorter
+
+    def on_created(self, event):
+        self.sorter._submit_event(Path(event.src_path))
+
+    def on_moved(self, event):
+        # Renames into the Downloads folder (e.g. browser finishing a
+        # download) arrive as moved events - process the destination.
+        self.sorter._submit_event(Path(event.dest_path))
+
+
 class DownloadsSorter:
     """Class to handle automatic sorting of files in Downloads folder."""
     
@@ -57,32 +151,67 @@ class DownloadsSorter:
             "PDFs": {".pdf"}
         }
         
-        # Track existing files to avoid processing them again
-        self.existing_files: Set[str] = set()
-        
+        # Invert categories into a flat extension -> category lookup table.
+        # Extensions are short, repeated strings, so intern the keys to let
+        # dict lookups hit the pointer-equality fast path.
+        self._ext_to_category = {
+            sys.intern(ext): category
+            for category, extensions in self.categories.items()
+            for ext in extensions
+        }
+
+        # Specialized classifier compiled once for this instance's
+        # extension set (the categories are fixed at construction time)
+        self._categorize_extension = self._build_classifier()
+
+        # Category directory Paths, built once instead of re-joining
+        # downloads_path / category on every move
+        self._category_paths = {
+            category: self.downloads_path / category
+            for category in (*self.categories, "Others", "Rogue_Folders")
+        }
+
+        # Highest conflict suffix handed out per (category, stem), so repeated
+        # name collisions don't re-probe every earlier suffix
+        self._next_suffix: dict[tuple[str, str], int] = {}
+
         # Create category directories if they don't exist
         self._create_category_directories()
     
     def _create_category_directories(self):
         """Create category subdirectories in Downloads folder."""
-        for category in self.categories.keys():
-            category_path = self.downloads_path / category
-            if not category_path.exists():
-                category_path.mkdir(exist_ok=True)
+        # _category_paths already covers Others and Rogue_Folders; mkdir
+        # itself reports whether the directory existed, so no exists() probe
+        for category_path in self._category_paths.values():
+            try:
+                category_path.mkdir()
+            except FileExistsError:
+                pass
+            else:
                 logger.info(f"Created directory: {category_path}")
-        
-        # Create Rogue_Folders directory
-        rogue_path = self.downloads_path / "Rogue_Folders"
-        if not rogue_path.exists():
-            rogue_path.mkdir(exist_ok=True)
-            logger.info(f"Created directory: {rogue_path}")
-        
-        # Create Others directory
-        others_path = self.downloads_path / "Others"
-        if not others_path.exists():
-            others_path.mkdir(exist_ok=True)
-            logger.info(f"Created directory: {others_path}")
     
+    def _build_classifier(self):
+        """
+        Generate an extension classifier specialized to the configured
+        categories.
+
+        The mapping is fixed once __init__ finishes, so compile it into a
+        chain of constant comparisons - the bytecode compiler turns each
+        branch into LOAD_CONST + COMPARE_OP against an interned literal,
+        which beats a generic dict lookup for a switch this small and hot.
+
+        Returns:
+            A function mapping a lower-cased extension to its category name
+        """
+        lines = ["def _categorize(extension):"]
+        for extension, category in self._ext_to_category.items():
+            lines.append(f"    if extension == {extension!r}: return {category!r}")
+        lines.append("    return 'Other'")
+
+        namespace: dict = {}
+        exec("\n".join(lines), namespace)
+        return namespace["_categorize"]
+
     def _get_file_category(self, file_path: Path) -> str:
         """
         Determine the category of a file based on its extension.
@@ -93,67 +222,92 @@ class DownloadsSorter:
         Returns:
             Category name or "Other" if no category matches
         """
-        extension = file_path.suffix.lower()
-        
-        for category, extensions in self.categories.items():
-            if extension in extensions:
-                return category
-        
-        return "Other"
+        return self._categorize_extension(file_path.suffix.lower())
     
-    def _move_file(self, file_path: Path, category: str) -> bool:
+    def _move_file(self, file_path: Path, category: str) -> Path | None:
         """
         Move a file to its appropriate category directory.
-        
+
         Args:
             file_path: Path to the file to move
             category: Category directory name
-            
+
         Returns:
-            True if successful, False otherwise
+            The destination path if successful, None otherwise
         """
         try:
-            if category == "Other":
-                # Move files that don't match any category to Others folder
-                category_path = self.downloads_path / "Others"
-                destination = category_path / file_path.name
-                
-                # Handle filename conflicts
-                counter = 1
-                original_name = file_path.stem
-                original_ext = file_path.suffix
-                
-                while destination.exists():
-                    new_name = f"{original_name}_{counter}{original_ext}"
-                    destination = category_path / new_name
-                    counter += 1
-                
-                # Move the file
-                shutil.move(str(file_path), str(destination))
-                logger.info(f"Moved {file_path.name} to Others/")
-                return True
-            
-            category_path = self.downloads_path / category
-            destination = category_path / file_path.name
-            
-            # Handle filename conflicts
-            counter = 1
-            original_name = file_path.stem
-            original_ext = file_path.suffix
-            
-            while destination.exists():
-                new_name = f"{original_name}_{counter}{original_ext}"
-                destination = category_path / new_name
-                counter += 1
-            
-            # Move the file
-            shutil.move(str(file_path), str(destination))
-            logger.info(f"Moved {file_path.name} to {category}/")
-            return True
-            
+            # Files that don't match any category go to the Others folder
+            folder_name = "Others" if category == "Other" else category
+            category_path = self._category_paths[folder_name]
+
+            destination = self._reserve_destination(category_path, folder_name,
+                                                    file_path.name)
+
+            # Move the file over our placeholder. Log lazily at DEBUG -
+            # callers emit the user-facing INFO lines, one per event or one
+            # per batch.
+            try:
+                _rename(file_path, destination)
+            except BaseException:
+                # Don't leave the empty placeholder behind on failure
+                try:
+                    os.unlink(destination)
+                except OSError:
+                    pass
+                raise
+            logger.debug("Moved %s to %s/", file_path.name, folder_name)
+            return destination
+
         except Exception as e:
             logger.error(f"Error moving {file_path.name}: {e}")
-            return False
+            return None
+
+    def _reserve_destination(self, category_path: Path, folder_name: str,
+                             name: str) -> Path:
+        """
+        Atomically claim a destination name in a category directory.
+
+        Moves run concurrently on the startup pool and the event workers,
+        and an exists() probe followed by a rename is a data-loss race:
+        POSIX rename silently replaces an existing destination, so two
+        movers resolving to the same name would destroy one of the files.
+        Creating the destination with O_CREAT|O_EXCL claims the name
+        atomically against both other threads and external writers; the
+        caller's rename then replaces our own empty placeholder. Conflict
+        suffixes still start from the highest value recorded for the name
+        in _next_suffix instead of re-probing _1, _2, ...
+
+        Args:
+            category_path: Directory the file is moving into
+            folder_name: Category key for the suffix cache
+            name: The file's original name
+
+        Returns:
+            The reserved destination path
+        """
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+        destination = category_path / name
+        try:
+            os.close(os.open(destination, flags))
+            return destination
+        except FileExistsError:
+            pass
+
+        stem, ext = os.path.splitext(name)
+        key = (folder_name, stem)
+        counter = self._next_suffix.get(key, 0)
+        while True:
+            counter += 1
+            destination = category_path / f"{stem}_{counter}{ext}"
+            try:
+                os.close(os.open(destination, flags))
+            except FileExistsError:
+                continue
+            # A racing thread may publish a lower counter right after us;
+            # that only costs extra probes on a later conflict, never a
+            # duplicate claim - O_EXCL is the arbiter.
+            self._next_suffix[key] = counter
+            return destination
     
     def _move_folder_to_rogue(self, folder_path: Path) -> bool:
         """
@@ -166,7 +320,7 @@ class DownloadsSorter:
             True if successful, False otherwise
         """
         try:
-            rogue_path = self.downloads_path / "Rogue_Folders"
+            rogue_path = self._category_paths["Rogue_Folders"]
             destination = rogue_path / folder_path.name
             
             # Handle folder name conflicts
@@ -179,7 +333,7 @@ class DownloadsSorter:
                 counter += 1
             
             # Move the folder
-            shutil.move(str(folder_path), str(destination))
+            _rename(folder_path, destination)
             logger.info(f"Moved folder {folder_path.name} to Rogue_Folders/")
             return True
             
@@ -187,101 +341,218 @@ class DownloadsSorter:
             logger.error(f"Error moving folder {folder_path.name}: {e}")
             return False
     
-    def _cleanup_redundant_zips(self):
+    def _cleanup_redundant_zips(self, moved_zips: list[Path]):
         """
-        Check Zip_Files folder for zip files that have corresponding extracted folders
-        and delete the zip files if the folders exist.
+        Delete just-moved zip files whose extracted folder already exists
+        in the Zip_Files directory.
+
+        Args:
+            moved_zips: Destination paths of zips moved into Zip_Files
         """
-        zip_folder = self.downloads_path / "Zip_Files"
-        if not zip_folder.exists():
+        if not moved_zips:
             return
-        
+
         try:
-            for item in zip_folder.iterdir():
-                if item.is_file() and item.suffix.lower() in {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".lzma", ".cab", ".iso"}:
-                    # Get the name without extension
-                    zip_name_without_ext = item.stem
-                    
-                    # Check if there's a folder with the same name
-                    corresponding_folder = zip_folder / zip_name_without_ext
-                    if corresponding_folder.exists() and corresponding_folder.is_dir():
-                        # Delete the zip file since we have the extracted folder
-                        item.unlink()
-                        logger.info(f"Deleted redundant zip file: {item.name} (folder exists)")
-                        
+            # One directory listing for the whole batch instead of an
+            # exists() + is_dir() probe per zip
+            with os.scandir(self._category_paths["Zip_Files"]) as entries:
+                existing_dirs = {
+                    entry.name for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                }
+
+            for zip_path in moved_zips:
+                if zip_path.stem in existing_dirs:
+                    # Delete the zip file since we have the extracted folder
+                    zip_path.unlink()
+                    logger.info(f"Deleted redundant zip file: {zip_path.name} (folder exists)")
+
         except Exception as e:
             logger.error(f"Error during zip cleanup: {e}")
     
     def _scan_and_sort_existing_files(self):
         """Scan Downloads folder and sort any existing files and folders."""
         logger.info("Scanning for existing files and folders to sort...")
-        
-        for item_path in self.downloads_path.iterdir():
-            if item_path.is_file():
-                filename = item_path.name
-                if filename not in self.existing_files:
-                    category = self._get_file_category(item_path)
-                    if category != "Other":
-                        self._move_file(item_path, category)
-                    self.existing_files.add(filename)
-            elif item_path.is_dir():
-                # Handle folders - move non-category folders to Rogue_Folders
-                folder_name = item_path.name
-                # List of folders to ignore (leave in base directory)
-                ignored_folders = {"Rogue_Folders", "Others", "gcode drop"}
-                if folder_name not in self.categories.keys() and folder_name not in ignored_folders:
-                    self._move_folder_to_rogue(item_path)
-    
-    def _get_current_files(self) -> Set[str]:
-        """Get set of current filenames in Downloads folder."""
-        return {f.name for f in self.downloads_path.iterdir() if f.is_file()}
-    
-    def _process_new_files(self, current_files: Set[str]):
-        """Process any new files and folders that have been added."""
-        new_files = current_files - self.existing_files
-        
-        for filename in new_files:
-            file_path = self.downloads_path / filename
-            if file_path.is_file():
-                category = self._get_file_category(file_path)
-                self._move_file(file_path, category)
-                self.existing_files.add(filename)
-            elif file_path.is_dir():
-                # Handle new folders - move non-category folders to Rogue_Folders
-                folder_name = file_path.name
-                # List of folders to ignore (leave in base directory)
-                ignored_folders = {"Rogue_Folders", "Others", "gcode drop"}
-                if folder_name not in self.categories.keys() and folder_name not in ignored_folders:
-                    self._move_folder_to_rogue(file_path)
-        
-        # Check for redundant zip files after processing new items
-        self._cleanup_redundant_zips()
+
+        # os.scandir answers is_file/is_dir from the directory entry itself,
+        # avoiding a stat syscall per entry; Path objects are only built for
+        # entries we actually move.
+        # Classify everything first (cheap dict lookups), then dispatch the
+        # latency-bound moves through a thread pool so they overlap.
+        file_moves: list[tuple[Path, str]] = []
+        with os.scandir(self.downloads_path) as entries:
+            for entry in entries:
+                if _should_skip(entry.name):
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    # Classify straight from the raw name - splitext plus one
+                    # dict lookup - so unmoved files never cost a Path object
+                    extension = os.path.splitext(entry.name)[1].lower()
+                    category = self._ext_to_category.get(extension)
+                    if category is not None:
+                        file_moves.append((Path(entry.path), category))
+                elif entry.is_dir(follow_symlinks=False):
+                    # Handle folders - move non-category folders to Rogue_Folders
+                    folder_name = entry.name
+                    # List of folders to ignore (leave in base directory)
+                    ignored_folders = {"Rogue_Folders", "Others", "gcode drop"}
+                    if folder_name not in self.categories.keys() and folder_name not in ignored_folders:
+                        self._move_folder_to_rogue(Path(entry.path))
+
+        if file_moves:
+            with ThreadPoolExecutor(max_workers=MAX_MOVE_WORKERS) as pool:
+                results = list(pool.map(lambda move: self._move_file(*move), file_moves))
+
+            # One summary line for the whole batch instead of a line per file
+            moved_per_category = Counter(
+                category for (_, category), ok in zip(file_moves, results) if ok
+            )
+            if moved_per_category:
+                logger.info("Moved %d files: %s",
+                            sum(moved_per_category.values()),
+                            ", ".join(f"{category}={count}"
+                                      for category, count in sorted(moved_per_category.items())))
+
+            self._cleanup_redundant_zips([
+                destination for (_, category), destination in zip(file_moves, results)
+                if destination and category == "Zip_Files"
+            ])
     
-    def start_monitoring(self, scan_interval: int = 5):
+    def _wait_until_stable(self, path: Path) -> bool:
         """
-        Start monitoring the Downloads folder for new files.
-        
+        Wait until a file's size and mtime stop changing.
+
+        A browser may fire events while it is still writing the file; moving
+        it mid-download would race with the writer. The wait is bounded to
+        STABLE_MAX_CHECKS samples so a long in-place write (torrent client,
+        curl -o, screen recording) cannot pin an event worker - the caller
+        re-queues the path and the worker moves on.
+
         Args:
-            scan_interval: How often to check for new files (in seconds)
+            path: Path to the file to watch
+
+        Returns:
+            True once the file is stable, False if it disappeared (e.g. the
+            downloader renamed it away) or was still changing after the
+            sample budget
+        """
+        try:
+            previous = os.stat(path)
+            for _ in range(STABLE_MAX_CHECKS):
+                time.sleep(STABLE_CHECK_INTERVAL)
+                current = os.stat(path)
+                if (current.st_size == previous.st_size
+                        and current.st_mtime == previous.st_mtime):
+                    return True
+                previous = current
+        except FileNotFoundError:
+            pass
+        return False
+
+    def _submit_event(self, path: Path):
+        """
+        Hand a watcher event to the worker threads.
+
+        The observer delivers events from a single dispatch thread;
+        _handle_new_path blocks on the stability wait and the move itself,
+        so running it inline would stall delivery of every other event.
+        The queue is bounded, so a burst that outruns the workers blocks
+        the producer rather than growing memory without limit.
         """
+        self._event_queue.put((path, 0))
+
+    def _event_worker(self):
+        """Drain the event queue until a None poison pill arrives."""
+        while True:
+            item = self._event_queue.get()
+            try:
+                if item is None:
+                    return
+                path, attempt = item
+                self._handle_new_path(path, attempt)
+            except Exception as e:
+                logger.error(f"Error handling {item}: {e}")
+            finally:
+                self._event_queue.task_done()
+
+    def _handle_new_path(self, path: Path, attempt: int = 0):
+        """Process a single new file or folder delivered by the watcher."""
+        # Ignore OS noise and in-progress downloads; a finished download's
+        # rename arrives as its own event
+        if _should_skip(path.name):
+            return
+        if path.is_file():
+            if not self._wait_until_stable(path):
+                # Still being written: retry from the back of the queue so
+                # other events keep flowing; after the retry budget, leave
+                # it for the next startup scan. A vanished file is dropped.
+                if path.exists():
+                    if attempt + 1 < MAX_EVENT_RETRIES:
+                        self._event_queue.put((path, attempt + 1))
+                    else:
+                        logger.warning(
+                            "%s is still being written after %d attempts; "
+                            "it will be sorted on the next startup scan",
+                            path.name, attempt + 1)
+                return
+            category = self._get_file_category(path)
+            destination = self._move_file(path, category)
+            if destination:
+                logger.info("Moved %s to %s/",
+                            path.name, "Others" if category == "Other" else category)
+                # Only a zip landing in Zip_Files can create a redundant pair
+                if category == "Zip_Files":
+                    self._cleanup_redundant_zips([destination])
+        elif path.is_dir():
+            # Handle new folders - move non-category folders to Rogue_Folders
+            folder_name = path.name
+            # List of folders to ignore (leave in base directory)
+            ignored_folders = {"Rogue_Folders", "Others", "gcode drop"}
+            if folder_name not in self.categories.keys() and folder_name not in ignored_folders:
+                self._move_folder_to_rogue(path)
+
+    def start_monitoring(self):
+        """Start monitoring the Downloads folder for new files."""
         logger.info(f"Starting Downloads folder monitoring...")
         logger.info(f"Monitoring: {self.downloads_path}")
-        logger.info(f"Scan interval: {scan_interval} seconds")
         logger.info("Press Ctrl+C to stop monitoring")
-        
-        # Initial scan of existing files
+
+        # Watch for new files via OS-level notifications instead of polling.
+        # Events flow through a bounded queue to worker threads, so the
+        # observer's dispatch thread never blocks on stability waits or
+        # moves, and bursts get back-pressure instead of unbounded buffering.
+        self._event_queue: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        workers = [
+            threading.Thread(target=self._event_worker, daemon=True)
+            for _ in range(MAX_EVENT_WORKERS)
+        ]
+        for worker in workers:
+            worker.start()
+
+        observer = Observer()
+        observer.schedule(DownloadsEventHandler(self), str(self.downloads_path), recursive=False)
+        observer.start()
+
+        # Initial scan of existing files, after the observer is live so
+        # files landing mid-scan aren't missed. A file both paths grab is
+        # harmless: the losing rename fails and _move_file tolerates it.
         self._scan_and_sort_existing_files()
-        
+
         try:
-            while True:
-                current_files = self._get_current_files()
-                self._process_new_files(current_files)
-                time.sleep(scan_interval)
-                
+            observer.join()
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
         except Exception as e:
             logger.error(f"Error during monitoring: {e}")
+        finally:
+            observer.stop()
+            observer.join()
+            # Finish queued events, then poison-pill the workers
+            self._event_queue.join()
+            for _ in workers:
+                self._event_queue.put(None)
+            for worker in workers:
+                worker.join()
 
 
 def main():
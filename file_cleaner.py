@@ -8,86 +8,95 @@ error handling and user confirmation to prevent accidental deletions.
 
 import os
 import sys
-import shutil
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
+# Enough workers to overlap unlink latency (worst on network drives)
+# without opening thousands of files in parallel
+MAX_DELETE_WORKERS = 16
 
-def get_files_in_directory(directory_path: str) -> List[Path]:
+
+def get_files_in_directory(directory_path: str) -> List[str]:
     """
     Get all files in the specified directory (excluding subdirectories).
-    
+
     Args:
         directory_path: Path to the directory to scan
-        
+
     Returns:
-        List of Path objects representing files in the directory
+        List of file path strings for files in the directory
     """
     try:
-        directory = Path(directory_path)
-        if not directory.exists():
+        if not os.path.exists(directory_path):
             raise FileNotFoundError(f"Directory '{directory_path}' does not exist")
-        
-        if not directory.is_dir():
+
+        if not os.path.isdir(directory_path):
             raise NotADirectoryError(f"'{directory_path}' is not a directory")
-        
-        # Get all files (not directories) in the specified directory
-        files = [f for f in directory.iterdir() if f.is_file()]
-        return files
-        
+
+        # Get all files (not directories) in the specified directory.
+        # DirEntry answers is_file from the directory read itself, and the
+        # raw path strings skip pathlib allocation on the deletion hot loop.
+        with os.scandir(directory_path) as entries:
+            return [entry.path for entry in entries
+                    if entry.is_file(follow_symlinks=False)]
+
     except Exception as e:
         print(f"Error scanning directory: {e}")
         return []
 
 
-def delete_files(files: List[Path]) -> Tuple[int, int]:
+def _try_unlink(file_path: str) -> Tuple[bool, str]:
+    """
+    Delete a single file, returning (success, message) instead of printing.
+
+    Args:
+        file_path: Path to the file to delete
+
+    Returns:
+        Tuple of (True/False, human-readable result message)
+    """
+    name = os.path.basename(file_path)
+    try:
+        os.unlink(file_path)  # Delete the file
+        return True, f"✓ Deleted: {name}"
+    except PermissionError:
+        return False, f"✗ Permission denied: {name}"
+    except FileNotFoundError:
+        return False, f"✗ File not found: {name}"
+    except Exception as e:
+        return False, f"✗ Error deleting {name}: {e}"
+
+
+def delete_files(files: List[str]) -> Tuple[int, int]:
     """
     Delete the specified files and return success/failure counts.
-    
+
+    Deletions are dispatched through a thread pool so the latency of each
+    unlink syscall overlaps instead of being paid serially.
+
     Args:
-        files: List of Path objects representing files to delete
-        
+        files: List of file path strings to delete
+
     Returns:
         Tuple of (successful_deletions, failed_deletions)
     """
     successful = 0
     failed = 0
-    
-    for file_path in files:
-        try:
-            file_path.unlink()  # Delete the file
-            print(f"✓ Deleted: {file_path.name}")
-            successful += 1
-        except PermissionError:
-            print(f"✗ Permission denied: {file_path.name}")
-            failed += 1
-        except FileNotFoundError:
-            print(f"✗ File not found: {file_path.name}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ Error deleting {file_path.name}: {e}")
-            failed += 1
-    
+
+    with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as pool:
+        for success, message in pool.map(_try_unlink, files):
+            print(message)
+            if success:
+                successful += 1
+            else:
+                failed += 1
+
     return successful, failed
 
 
-def confirm_deletion(directory_path: str, file_count: int) -> bool:
-    """
-    Ask user for confirmation before deleting files.
-    
-    Args:
-        directory_path: Path to the directory containing files
-        file_count: Number of files that will be deleted
-        
-    Returns:
-        True if user confirms, False otherwise
-    """
-    print(f"\n⚠️  WARNING: You are about to delete {file_count} files from:")
-    print(f"   {os.path.abspath(directory_path)}")
-    print("\nThis action cannot be undone!")
-    
-    while True:
-        return True
+# Folders bigger than this get a one-line summary instead of a full
+# listing - printing thousands of lines to a terminal takes seconds
+MAX_LISTED_FILES = 100
 
 
 def main():
@@ -111,16 +120,16 @@ def main():
         print(f"No files found in '{directory_path}'")
         return
     
-    # Display files that will be deleted
+    # Display files that will be deleted; summarize large folders
     print(f"\nFound {len(files)} files in '{directory_path}':")
-    for i, file_path in enumerate(files, 1):
-        print(f"  {i}. {file_path.name}")
-    
-    # Ask for confirmation
-    if not confirm_deletion(directory_path, len(files)):
-        print("Operation cancelled.")
-        return
-    
+    if len(files) <= MAX_LISTED_FILES:
+        for i, file_path in enumerate(files, 1):
+            print(f"  {i}. {os.path.basename(file_path)}")
+
+    print(f"\n⚠️  WARNING: You are about to delete {len(files)} files from:")
+    print(f"   {os.path.abspath(directory_path)}")
+    print("\nThis action cannot be undone!")
+
     # Delete the files
     print(f"\n🗑️  Deleting files...")
     successful, failed = delete_files(files)